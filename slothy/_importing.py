@@ -4,20 +4,19 @@ The core implementation of slothy importing.
 Inspired by https://gist.github.com/JelleZijlstra/23c01ceb35d1bc8f335128f59a32db4c.
 """
 
-# ruff: noqa: SLF001, FBT003, PLR0913
+# ruff: noqa: SLF001, PLR0913
 from __future__ import annotations
 
-from contextlib import contextmanager, nullcontext
-from contextvars import ContextVar, copy_context
-from functools import partial
-from pathlib import Path
-from sys import modules, version_info
-from typing import TYPE_CHECKING, Any, NamedTuple
+from contextlib import nullcontext
+from contextvars import ContextVar
+from os.path import realpath
+from sys import intern, modules, version_info
+from typing import TYPE_CHECKING, Any
 from warnings import warn
 
 if TYPE_CHECKING:
     from collections import defaultdict
-    from collections.abc import Callable, Iterator
+    from collections.abc import Callable
     from contextlib import AbstractContextManager
     from types import FrameType, ModuleType
     from typing import Final
@@ -41,18 +40,20 @@ __all__ = ("lazy_importing", "lazy_importing_if", "type_importing")
 
 MISSING: Final = object()
 
+original_import: Final = __import__
+"""The original [`builtins.__import__`][], as opposed to custom replacements."""
+
 tracker_var: ContextVar[defaultdict[type, WeakSet[Any]] | None] = ContextVar(
     "tracker_var", default=None
 )
 
 
-@contextmanager
 def lazy_importing(
     *,
     prevent_eager: bool = True,  # noqa: ARG001
     stack_offset: int = 1,
     _fallback: object = MISSING,
-) -> Iterator[None]:
+) -> AbstractContextManager[None]:
     """
     Use slothy imports in a `with` statement.
 
@@ -69,26 +70,11 @@ def lazy_importing(
 
     Returns
     -------
-    Iterator[None]
-        Context manager's underlying generator.
+    AbstractContextManager[None]
+        The context manager.
 
     """
-    frame = get_frame(stack_offset + 1)  # +1 from @contextmanager
-    builtin_import = _get_builtin_import(frame.f_builtins)
-
-    import_wrapper = partial(
-        _slothy_import_locally,
-        _target=frame.f_globals["__name__"],
-        _builtin_import=builtin_import,
-    )
-    import_wrapper.__slothy__ = True  # type: ignore[attr-defined]
-
-    frame.f_builtins["__import__"] = import_wrapper
-    try:
-        yield
-    finally:
-        _process_slothy_objects(frame.f_locals, fallback=_fallback)
-        frame.f_builtins["__import__"] = builtin_import
+    return _LazyImporting(stack_offset=stack_offset, fallback=_fallback)
 
 
 def type_importing(
@@ -157,9 +143,65 @@ def lazy_importing_if(
     )
 
 
-def _is_slothy_import(obj: object) -> object:
-    """Determine if an `__import__` function is slothy-managed."""
-    return getattr(obj, "__slothy__", None)
+class _LazyImporting:
+    """Context manager returned by `lazy_importing()`."""
+
+    __slots__ = ("_fallback", "_frame", "_import_wrapper", "_stack_offset")
+
+    def __init__(self, stack_offset: int, fallback: object) -> None:
+        """
+        Create a new slothy importing context manager.
+
+        Parameters
+        ----------
+        stack_offset
+            The stack offset of the frame to use slothy imports in.
+        fallback
+            The fallback object to bind in case delayed imports fail.
+
+        """
+        self._stack_offset = stack_offset
+        self._fallback = fallback
+        self._frame: FrameType | None = None
+        self._import_wrapper: _SlothyImport | None = None
+
+    def __enter__(self) -> None:
+        """Replace `__import__` in the frame's builtins with slothy import."""
+        if self._frame is not None:
+            msg = "Slothy importing context manager is already entered"
+            raise RuntimeError(msg)
+        frame = get_frame(self._stack_offset)
+        try:
+            builtin_import = frame.f_builtins["__import__"]
+        except KeyError:  # pragma: no cover
+            # No possibility of running into this unless (1) you're manually setting
+            # `__builtins__` namespace that lacks the `__import__` function or (2) you
+            # removed the `__import__` key from parent or target frame's `f_builtins`.
+            # This is so unlikely to happen!
+            msg = "__import__ not found"
+            raise ImportError(msg) from None
+        import_wrapper = _SlothyImport(frame.f_globals, builtin_import)
+        frame.f_builtins["__import__"] = import_wrapper
+        self._frame = frame
+        self._import_wrapper = import_wrapper
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Bind slothy objects created in the block and restore `__import__`."""
+        frame, import_wrapper = self._frame, self._import_wrapper
+        if frame is None or import_wrapper is None:  # pragma: no cover
+            # Never leave a slothy import installed in the caller's builtins.
+            builtins = get_frame(self._stack_offset).f_builtins
+            their_import = builtins.get("__import__")
+            if type(their_import) is _SlothyImport:
+                builtins["__import__"] = their_import.builtin_import
+            msg = "Slothy importing context manager was not entered"
+            raise RuntimeError(msg)
+        self._frame = self._import_wrapper = None
+        try:
+            # Also rebinds aliases of slothy objects from earlier blocks.
+            _process_slothy_objects(frame.f_locals, fallback=self._fallback)
+        finally:
+            frame.f_builtins["__import__"] = import_wrapper.builtin_import
 
 
 def _process_slothy_objects(
@@ -181,29 +223,59 @@ def _process_slothy_objects(
         The fallback object to bind to all objects in case their delayed imports fail.
 
     """
-    for ref, value in local_ns.copy().items():
-        if not isinstance(value, SlothyObject):
-            continue
-
-        value._SlothyObject__fallback = fallback
+    # Collect first: binding keys below mutates the namespace.
+    slothy_items = [
+        (ref, value)
+        for ref, value in local_ns.items()
+        if isinstance(value, SlothyObject)
+    ]
+    pop_module = modules.pop
+    for ref, value in slothy_items:
+        value._SlothyObject__fallback = fallback  # type: ignore[misc]  # (mangled slot)
 
         if isinstance(ref, _SlothyKey):
             ref.obj = value
             continue
 
         local_ns[_SlothyKey(ref, value)] = value
-        module_name = value._SlothyObject__args.module_name
-        modules.pop(module_name, None)
+        pop_module(value._SlothyObject__args.module_name, None)
 
 
-class _ImportArgs(NamedTuple):
+class _ImportArgs:
     """Arguments eventually passed to [`builtins.__import__`][]."""
 
-    module_name: str
-    global_ns: dict[str, object]
-    local_ns: dict[str, object]
-    from_list: tuple[str, ...]
-    level: int
+    __slots__ = ("from_list", "global_ns", "level", "local_ns", "module_name")
+
+    def __init__(
+        self,
+        module_name: str,
+        global_ns: dict[str, object],
+        local_ns: dict[str, object],
+        from_list: tuple[str, ...],
+        level: int,
+    ) -> None:
+        """
+        Store the import arguments.
+
+        Parameters
+        ----------
+        module_name
+            The name of the module to import.
+        global_ns
+            The global namespace of the import.
+        local_ns
+            The local namespace of the import.
+        from_list
+            The names imported in a `from ... import ...` statement.
+        level
+            The level of a relative import.
+
+        """
+        self.module_name = module_name
+        self.global_ns = global_ns
+        self.local_ns = local_ns
+        self.from_list = from_list
+        self.level = level
 
 
 def _import_item_from_list(
@@ -255,37 +327,63 @@ def _import_item_from_list(
     return obj
 
 
-def _get_builtin_import(builtins: dict[str, Any]) -> Callable[..., Any]:
-    try:
-        builtin_import: Callable[..., Any] = builtins["__import__"]
-    except KeyError:  # pragma: no cover
-        # No possibility of running into this unless (1) you're manually setting
-        # `__builtins__` namespace that lacks the `__import__` function or (2) you
-        # removed the `__import__` key from parent or target frame's `f_builtins`.
-        # This is so unlikely to happen!
-        msg = "__import__ not found"
-        raise ImportError(msg) from None
-    return builtin_import
+def _get_cached_module(
+    builtin_import: Callable[..., object],
+    module_name: str,
+    from_list: tuple[str, ...] | None,
+    level: int,
+) -> ModuleType | None:
+    """Get what `builtin_import` would return if everything is already loaded."""
+    if builtin_import is not original_import or level:
+        # Custom `__import__` functions must see every import (like in CPython)
+        # and relative imports need to be resolved by the import system.
+        return None
+    module = modules.get(module_name)
+    spec = getattr(module, "__spec__", None)
+    if module is None or getattr(spec, "_initializing", False):
+        # Let the import system wait for modules other threads are still executing.
+        return None
+    if from_list:
+        # Missing items might be submodules that still need to be imported.
+        namespace = vars(module)
+        for item in from_list:
+            if item not in namespace:
+                return None
+        return module
+    # `import a.b.c` binds the top-level package `a`.
+    dot = module_name.find(".")
+    return module if dot < 0 else modules.get(module_name[:dot])
 
 
 class SlothyObject:
     """Slothy object. You should not be using this directly."""
 
+    __slots__: tuple[str, ...] = (
+        "__args",
+        "__builtins",
+        "__children",
+        "__fallback",
+        "__item_from_list",
+        "__refs",
+        "__repr",
+        "__source",
+        "__submodule",
+        "__weakref__",
+    )
+
     if TYPE_CHECKING:
         _SlothyObject__args: _ImportArgs
         _SlothyObject__builtins: dict[str, Any]
-        _SlothyObject__item_from_list: str
-        _SlothyObject__source: str | None
         _SlothyObject__fallback: object
-        _SlothyObject__refs: set[str]
-        _SlothyObject__import: Callable[[Callable[..., ModuleType] | None], None]
+        _SlothyObject__refs: list[str]
+        _SlothyObject__import: Callable[[Callable[..., ModuleType] | None], object]
 
     def __init__(
         self,
         args: _ImportArgs,
         builtins: dict[str, Any],
         item_from_list: str | None = None,
-        source: str | None = None,
+        source: tuple[str, int] | None = None,
     ) -> None:
         """
         Create a new slothy object.
@@ -299,7 +397,8 @@ class SlothyObject:
         item_from_list
             One item in a `from ... import [item1, item2, ...]` import.
         source
-            The source of the import.
+            The file name and line number of the import.
+            Formatted only when needed.
 
         """
         super().__init__()
@@ -308,30 +407,46 @@ class SlothyObject:
         self.__item_from_list = item_from_list
         self.__source = source
         self.__fallback = MISSING
-        self.__refs: set[str] = set()
+        # Usually one or two names, so a list is cheaper than a set.
+        self.__refs: list[str] = []
+        self.__repr: str | None = None
+        self.__children: dict[str, SlothyObject] | None = None
+        _, _, self.__submodule = args.module_name.rpartition(".")
 
         if (tracker := tracker_var.get()) is not None:
             tracker[type(self)].add(self)
 
-    def __unmount_in_context(self, obj: object = MISSING) -> None:
-        local_ns = self.__args.local_ns
-        for ref in self.__refs:
-            existing_value = local_ns.get(ref)
-            if existing_value is self:
-                del local_ns[ref]
-                if obj is not MISSING:
-                    local_ns[ref] = obj
-
     def __unmount(self, obj: object = MISSING) -> None:
-        ctx = copy_context()
-        ctx.run(unmounting.set, True)
-        ctx.run(self.__unmount_in_context, obj)
+        local_ns = self.__args.local_ns
+        token = unmounting.set(True)
+        try:
+            for ref in self.__refs:
+                existing_value = local_ns.get(ref)
+                if existing_value is self:
+                    del local_ns[ref]
+                    if obj is not MISSING:
+                        local_ns[ref] = obj
+        finally:
+            unmounting.reset(token)
 
     def __import(self, builtin_import: Callable[..., ModuleType]) -> object:
         """Actually import the object."""
         try:
             import_args = self.__args
-            module = builtin_import(*import_args)
+            module = _get_cached_module(
+                builtin_import,
+                import_args.module_name,
+                import_args.from_list,
+                import_args.level,
+            )
+            if module is None:
+                module = builtin_import(
+                    import_args.module_name,
+                    import_args.global_ns,
+                    import_args.local_ns,
+                    import_args.from_list,
+                    import_args.level,
+                )
             if self.__item_from_list:
                 obj = _import_item_from_list(
                     import_args=import_args,
@@ -347,13 +462,14 @@ class SlothyObject:
                 self.__unmount(fallback)
                 return fallback
             self.__unmount()
+            if not self.__source:
+                raise exc from None
+            note = f"(caused by delayed execution of {_format_source(*self.__source)})"
+            if hasattr(exc, "add_note"):  # Python 3.11+
+                exc.add_note(note)
+                raise exc from None
             args = exc.args
-            if self.__source:
-                args = (
-                    (args[0] if args else "")
-                    + f"\n(caused by delayed execution of {self.__source})",
-                    *args[1:],
-                )
+            args = ((args[0] if args else "") + f"\n{note}", *args[1:])
             exc = type(exc)(*args).with_traceback(exc.__traceback__)
             raise exc from None
         else:
@@ -362,7 +478,7 @@ class SlothyObject:
 
     def __set_name__(self, owner: type, name: str) -> None:
         """Set the name of the object."""
-        self.__refs.add(name)
+        self.__refs.append(name)
         self.__unmount()
         delattr(owner, name)
         msg = "Class-scoped lazy imports are not supported"
@@ -374,9 +490,15 @@ class SlothyObject:
 
     def __repr__(self) -> str:
         """Represent the slothy object using a simulated import statement."""
-        source = self.__source or ""
-        if source:
-            source = " " + source.join("()")
+        # Everything the representation depends on is set once in `__init__`.
+        if self.__repr is None:
+            self.__repr = self.__represent()
+        return self.__repr
+
+    def __represent(self) -> str:
+        source = ""
+        if self.__source:
+            source = f" ({_format_source(*self.__source)})"
 
         item = self.__item_from_list
         module_name = self.__args.module_name
@@ -398,19 +520,25 @@ class SlothyObject:
     def __getattr__(self, item: str) -> object:
         """Allow import chains."""
         if self.__args.from_list and self.__item_from_list is None:
-            return SlothyObject(
+            children = self.__children
+            if children is None:
+                children = self.__children = {}
+            elif item in children:
+                return children[item]
+            child = children[item] = SlothyObject(
                 args=self.__args,
                 builtins=self.__builtins,
-                item_from_list=item,
+                item_from_list=intern(item),
                 source=self.__source,
             )
-        _, _, submodule = self.__args.module_name.rpartition(".")
-        if item != submodule:
+            return child
+        if item != self.__submodule:
             raise AttributeError(item)
         return self
 
 
 unmounting: ContextVar[bool] = ContextVar("unmounting", default=False)
+_is_unmounting = unmounting.get
 
 
 class _SlothyKey(str):
@@ -419,6 +547,7 @@ class _SlothyKey(str):
     __slots__: tuple[str, ...] = (
         "key",
         "obj",
+        "_builtins",
         "_hash",
         "_import",
         "_should_refresh",
@@ -441,9 +570,12 @@ class _SlothyKey(str):
             The object to use.
 
         """
-        obj._SlothyObject__refs.add(key)
-        self.key = key
+        refs = obj._SlothyObject__refs
+        if key not in refs:
+            refs.append(key)
+        self.key = intern(key)
         self.obj = obj
+        self._builtins = obj._SlothyObject__builtins
         self._hash = hash(key)
         self._import = obj._SlothyObject__import
         self._should_refresh = True
@@ -473,10 +605,10 @@ class _SlothyKey(str):
             return NotImplemented
         elif key != self.key:  # pragma: no cover  # noqa: RET505 (elifs instead of ifs)
             return False
-        elif unmounting.get():
+        elif _is_unmounting():
             return True
-        their_import = self.obj._SlothyObject__builtins.get("__import__")
-        if not _is_slothy_import(their_import):
+        their_import = self._builtins.get("__import__")
+        if type(their_import) is not _SlothyImport:
             self._import(their_import)
             return True
         local_ns = self.obj._SlothyObject__args.local_ns
@@ -491,15 +623,21 @@ class _SlothyKey(str):
         return self._hash
 
 
-def _format_source(frame: FrameType) -> str:
+resolved_filenames: dict[str, str] = {}
+"""Resolved paths of files that made slothy imports, by their code filenames."""
+
+
+def _format_source(ffn: str, lineno: int) -> str:
     """Refer to an import in the `<file name>:<line number>` format."""
-    ffn = frame.f_code.co_filename
     # Empty and special names (like "<stdin>"). Same logic is used in `linecache`.
     if not ffn or ffn.startswith("<") and ffn.endswith(">"):  # pragma: no cover
         filename = ffn
     else:
-        filename = str(Path(ffn).resolve())
-    return f'"{filename}", line {frame.f_lineno}'
+        try:
+            filename = resolved_filenames[ffn]
+        except KeyError:
+            filename = resolved_filenames[ffn] = realpath(ffn)
+    return f'"{filename}", line {lineno}'
 
 
 def _slothy_import(
@@ -520,29 +658,68 @@ def _slothy_import(
         msg = "Wildcard slothy imports are not supported"
         raise RuntimeError(msg)
     frame = get_frame(stack_offset)
-    args = _ImportArgs(name, global_ns, local_ns, from_list, level)
-    source = _format_source(frame)
+    # The name is used for several `sys.modules` lookups later on.
+    args = _ImportArgs(intern(name), global_ns, local_ns, from_list, level)
+    source = frame.f_code.co_filename, frame.f_lineno
     return SlothyObject(args=args, builtins=frame.f_builtins, source=source)
 
 
-def _slothy_import_locally(
-    name: str,
-    global_ns: dict[str, object] | None = None,
-    local_ns: dict[str, object] | None = None,
-    from_list: tuple[str, ...] | None = None,
-    level: int = 0,
-    *,
-    _target: str,
-    _builtin_import: Callable[..., object],
-    _stack_offset: int = 1,
-) -> object:
-    """Slothily import an object only in slothy importing context manager."""
-    frame = get_frame(_stack_offset)
-    global_ns = frame.f_globals if global_ns is None else global_ns
-    local_ns = frame.f_locals if local_ns is None else local_ns
-    args = name, global_ns, local_ns, from_list or (), level
-    return modules.get(name) or (
-        _builtin_import(*args)
-        if global_ns["__name__"] != _target
-        else _slothy_import(*args, _stack_offset + 1)
-    )
+class _SlothyImport:
+    """Replacement of [`builtins.__import__`][] in slothy importing context manager."""
+
+    __slots__ = ("builtin_import", "slothy_objects", "target_ns")
+
+    def __init__(
+        self,
+        target_ns: dict[str, object],
+        builtin_import: Callable[..., object],
+    ) -> None:
+        """
+        Create a new slothy import function.
+
+        Parameters
+        ----------
+        target_ns
+            The global namespace of the module that uses slothy imports.
+        builtin_import
+            The [`builtins.__import__`][] function to use for other modules.
+
+        """
+        self.target_ns = target_ns
+        self.builtin_import = builtin_import
+        # Identical imports into one namespace share a single slothy object.
+        self.slothy_objects: dict[
+            tuple[str, int, tuple[str, ...], int], SlothyObject
+        ] = {}
+
+    def __call__(
+        self,
+        name: str,
+        global_ns: dict[str, object] | None = None,
+        local_ns: dict[str, object] | None = None,
+        from_list: tuple[str, ...] | None = None,
+        level: int = 0,
+    ) -> object:
+        """Slothily import an object only in slothy importing context manager."""
+        module = _get_cached_module(self.builtin_import, name, from_list, level)
+        if module is not None:
+            return module
+        # The interpreter passes the importing frame's namespaces on its own,
+        # so fetching the frame is only a fallback for manual `__import__()` calls.
+        if global_ns is None:
+            global_ns = get_frame(1).f_globals
+        if global_ns is not self.target_ns:
+            return self.builtin_import(
+                name, global_ns, local_ns, from_list or (), level
+            )
+        if local_ns is None:
+            local_ns = get_frame(1).f_locals
+        # Manual `__import__()` calls may pass the fromlist as a list.
+        from_list = tuple(from_list) if from_list else ()
+        key = name, level, from_list, id(local_ns)
+        slothy_object = self.slothy_objects.get(key)
+        if slothy_object is None:
+            slothy_object = self.slothy_objects[key] = _slothy_import(
+                name, global_ns, local_ns, from_list, level, stack_offset=2
+            )
+        return slothy_object
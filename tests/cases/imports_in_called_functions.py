@@ -0,0 +1,34 @@
+# tests for imports made by functions called inside slothy blocks
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from slothy import lazy_importing
+
+if TYPE_CHECKING:
+    from pytest_subtests import SubTests
+
+    subtests: SubTests
+    supported: bool
+
+
+def import_module() -> ModuleType:
+    import module
+
+    return module
+
+
+with lazy_importing(prevent_eager=False):
+    import_module()
+    import module
+    import package1
+
+with subtests.test("block-imports-processed"):
+    if supported:
+        assert "package1" not in sys.modules
+    assert isinstance(package1, ModuleType)
+
+with subtests.test("same-import-in-function-not-shared"):
+    assert isinstance(module, ModuleType)
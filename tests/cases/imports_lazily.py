@@ -1,11 +1,14 @@
 # core tests
 from __future__ import annotations
 
+import builtins
 import re
 import sys
 from pathlib import Path
+from threading import Thread
+from time import sleep
 from types import ModuleType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -77,67 +80,79 @@ with lazy_importing(prevent_eager=False):
             # We'll make it work later.
             from package1 import fake as package1_fake  # type: ignore[attr-defined]
 
+    with subtests.test("identical-imports-share-slothy-objects"):
+        import module as module_alias
+        from package1.submodule1 import member1 as m1_1_alias
+
+        # Manual calls may pass the fromlist as a list.
+        submodule1 = __import__("package1.submodule1", globals(), locals(), ["member1"])
+
+        if supported:
+            assert module_alias is module
+            assert m1_1_alias is m1_1
+            assert submodule1.member1 is m1_1
+
+    with subtests.test("fromlist-aliases-share-slothy-objects"):
+        from module import attr as attr_a, attr as attr_b  # noqa: I001
+
+        if supported:
+            assert attr_a is attr_b
+
     if supported:
         PATH_HERE = str(Path(__file__).resolve())
         SRC_REF = rf'"{re.escape(PATH_HERE)}", line \d+'
 
+        REPR_PATTERN = re.compile(rf"<(.+) \({SRC_REF}\)>")
+
+        def repr_statement(obj: object) -> str:
+            match = REPR_PATTERN.fullmatch(repr(obj))
+            assert match
+            return match[1]
+
         with subtests.test("slothy-object-repr"):
             from slothy._importing import SlothyObject
 
             assert isinstance(module, SlothyObject)
-            assert re.fullmatch(rf"<import module \({SRC_REF}\)>", repr(module))
+            assert repr_statement(module) == "import module"
 
             assert isinstance(pkg, SlothyObject)
-            assert re.fullmatch(rf"<import package1 \({SRC_REF}\)>", repr(pkg))
+            assert repr_statement(pkg) == "import package1"
 
             assert isinstance(attr, SlothyObject)
-            assert re.fullmatch(rf"<from module import attr \({SRC_REF}\)>", repr(attr))
+            assert repr_statement(attr) == "from module import attr"
 
             assert isinstance(subpackage, SlothyObject)
-            assert re.fullmatch(
-                rf"<from package1 import subpackage \({SRC_REF}\)>",
-                repr(subpackage),
+            assert repr_statement(subpackage) == "from package1 import subpackage"
+
+            # Neighboring fromlist members.
+            assert isinstance(m1_1, SlothyObject)
+            assert repr_statement(m1_1) == "from package1.submodule1 import member1"
+
+            assert isinstance(m2_1, SlothyObject)
+            assert (
+                repr_statement(m2_1) == "from package1.submodule2 import member1, ..."
             )
 
-            with subtests.test("representing-neighboring-fromlist-members"):
-                assert isinstance(m1_1, SlothyObject)
-                assert re.fullmatch(
-                    rf"<from package1.submodule1 import member1 \({SRC_REF}\)>",
-                    repr(m1_1),
-                )
-
-                assert isinstance(m2_1, SlothyObject)
-                assert re.fullmatch(
-                    rf"<from package1.submodule2 import member1, ... \({SRC_REF}\)>",
-                    repr(m2_1),
-                )
-
-                assert isinstance(m2_2, SlothyObject)
-                assert re.fullmatch(
-                    rf"<from package1.submodule2 import ..., member2 \({SRC_REF}\)>",
-                    repr(m2_2),
-                )
-
-                assert isinstance(m3_1, SlothyObject)
-                assert re.fullmatch(
-                    rf"<from package1.submodule3 import member1, ... \({SRC_REF}\)>",
-                    repr(m3_1),
-                )
-
-                assert isinstance(m3_2, SlothyObject)
-                assert re.fullmatch(
-                    (
-                        r"<from package1.submodule3 import ..., member2, "
-                        rf"... \({SRC_REF}\)>"
-                    ),
-                    repr(m3_2),
-                )
-
-                assert isinstance(m3_3, SlothyObject)
-                assert re.fullmatch(
-                    rf"<from package1.submodule3 import ..., member3 \({SRC_REF}\)>",
-                    repr(m3_3),
-                )
+            assert isinstance(m2_2, SlothyObject)
+            assert (
+                repr_statement(m2_2) == "from package1.submodule2 import ..., member2"
+            )
+
+            assert isinstance(m3_1, SlothyObject)
+            assert (
+                repr_statement(m3_1) == "from package1.submodule3 import member1, ..."
+            )
+
+            assert isinstance(m3_2, SlothyObject)
+            assert (
+                repr_statement(m3_2)
+                == "from package1.submodule3 import ..., member2, ..."
+            )
+
+            assert isinstance(m3_3, SlothyObject)
+            assert (
+                repr_statement(m3_3) == "from package1.submodule3 import ..., member3"
+            )
 
     expected_module_entries: tuple[str, ...] = (
         "module",
@@ -170,23 +185,42 @@ with lazy_importing(prevent_eager=False):
     def test_all_imported() -> None:
         assert isinstance(module, ModuleType)
         assert isinstance(pkg, ModuleType)
-        assert isinstance(attr, int)
         assert isinstance(subpackage, ModuleType)
         assert isinstance(subsubmodule, ModuleType)
         assert isinstance(package2.submodule, ModuleType)
-        assert isinstance(m1_1, int)
-        assert isinstance(m2_1, int)
-        assert isinstance(m2_2, int)
-        assert isinstance(m3_1, int)
-        assert isinstance(m3_2, int)
-        assert isinstance(m3_3, int)
+        for member in (attr, m1_1, m2_1, m2_2, m3_1, m3_2, m3_3):
+            assert type(member) is int, member
+        assert module_alias is module
+        assert isinstance(submodule1, ModuleType)
+        assert m1_1_alias == submodule1.member1 == m1_1
+        if not supported:
+            assert attr_a == attr_b == 1
 
         if supported:
-            with pytest.raises(
-                ImportError,
-                match=rf"\(caused by delayed execution of {SRC_REF}\)",
-            ):
+            note_pattern = rf"\(caused by delayed execution of {SRC_REF}\)"
+            with pytest.raises(ImportError) as exc_info:
                 delusion
+            if hasattr(exc_info.value, "add_note"):  # Python 3.11+
+                notes = getattr(exc_info.value, "__notes__", None)
+                assert notes
+                assert re.fullmatch(note_pattern, notes[-1])
+            else:
+                assert re.search(note_pattern, str(exc_info.value))
+            # The traceback refers to the slothy object that failed to import.
+            del exc_info
+
+            delayed_imports = []
+
+            def tracking_import(*args: Any) -> ModuleType:
+                delayed_imports.append(args[0])
+                return builtin_import(*args)
+
+            builtins.__import__ = tracking_import  # type: ignore[assignment]
+            try:
+                assert attr_a == attr_b == 1
+            finally:
+                builtins.__import__ = builtin_import
+            assert delayed_imports == ["module"]
 
             import fake
 
@@ -204,13 +238,10 @@ with subtests.test("module-registry-purged"):
     if supported:
         # This behavior is necessary, because we want the same imports
         # to perform actual imports in non-slothy mode.
-        for module_entry in expected_module_entries:
-            assert module_entry not in sys.modules
+        assert not sys.modules.keys() & set(expected_module_entries)
     else:
-        for module_entry in expected_module_entries:
-            assert module_entry in sys.modules
-    for module_entry in unwanted_module_entries:
-        assert module_entry not in sys.modules
+        assert not set(expected_module_entries) - sys.modules.keys()
+    assert not sys.modules.keys() & set(unwanted_module_entries)
 
 with lazy_importing(prevent_eager=False), subtests.test("reenter-works"):
     # Should not be a problem if we re-enter.
@@ -222,9 +253,16 @@ with lazy_importing(prevent_eager=False), subtests.test("reenter-works"):
 with subtests.test("builtin-import-unchanged-after-reenter"):
     assert __import__ is builtin_import
 
+with lazy_importing(prevent_eager=False):
+    # No new imports, only an alias of a slothy object from the block above.
+    late_module_alias = module
+
 with subtests.test("imported-on-reference"):
     test_all_imported()
 
+with subtests.test("alias-from-later-block-imported"):
+    assert late_module_alias is module
+
 with lazy_importing_if(True, prevent_eager=False), subtests.test("slothy-if-true"):
     if supported:
         assert __import__ is not builtin_import
@@ -233,3 +271,32 @@ with lazy_importing_if(True, prevent_eager=False), subtests.test("slothy-if-true
 
 with lazy_importing_if(False, prevent_eager=False), subtests.test("slothy-if-false"):
     assert __import__ is builtin_import
+
+with subtests.test("cached-import-binds-top-level-package"):
+    import os.path
+
+    with lazy_importing(prevent_eager=False):
+        import os.path
+
+    assert os.__name__ == "os"
+
+with subtests.test("waits-for-module-initialized-by-another-thread"):
+    with lazy_importing(prevent_eager=False):
+        import slow_module
+
+    # `slow_module` is partially initialized until the other thread finishes.
+    importer = Thread(target=builtin_import, args=("slow_module",))
+    importer.start()
+    while "slow_module" not in sys.modules and importer.is_alive():
+        sleep(0.001)
+    assert slow_module.DONE
+    importer.join()
+
+if supported:
+    with subtests.test("reentering-same-context-manager-disallowed"):
+        slothy_block = lazy_importing(prevent_eager=False)
+        with slothy_block:
+            with pytest.raises(RuntimeError, match="already entered"), slothy_block:
+                pass
+            assert __import__ is not builtin_import
+        assert __import__ is builtin_import
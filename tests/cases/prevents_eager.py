@@ -1,6 +1,7 @@
 # tests for eager importing prevention
 from __future__ import annotations
 
+import re
 from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
@@ -14,18 +15,16 @@ if TYPE_CHECKING:
     supported: bool
     subtests: SubTests
 
+EAGER_MODE_ERROR = re.compile("cannot default to eager mode")
+no_error = nullcontext()
+
 for cm in (
     lambda: lazy_importing(prevent_eager=True),
     lambda: lazy_importing_if(True, prevent_eager=True),
     lambda: type_importing(),
 ):
     with subtests.test("prevents-eager"), (
-        nullcontext()
-        if supported
-        else pytest.raises(
-            RuntimeError,
-            match="cannot default to eager mode",
-        )
+        no_error if supported else pytest.raises(RuntimeError, match=EAGER_MODE_ERROR)
     ), cm():  # type: ignore[no-untyped-call]
         pass
 
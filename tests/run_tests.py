@@ -4,11 +4,10 @@ import gc
 import os
 import platform
 import re
-import runpy
 import sys
 from collections import defaultdict
 from contextlib import contextmanager
-from contextvars import Context, copy_context
+from contextvars import copy_context
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 from weakref import WeakSet
@@ -16,7 +15,8 @@ from weakref import WeakSet
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
+    from types import CodeType
 
     from pytest_subtests import SubTests
 
@@ -27,17 +27,38 @@ CASES_DIR: Path = Path("tests/cases/")
 assert not any(map(re.compile("slothy").search, sys.modules))
 
 initial_modules = sys.modules.copy()
+code_cache: dict[Path, CodeType] = {}
+
+
+def load_code(test_file: Path) -> CodeType:
+    # Some cases run more than once; parse and compile each file only once.
+    try:
+        return code_cache[test_file]
+    except KeyError:
+        code = code_cache[test_file] = compile(
+            test_file.read_bytes(), str(test_file), "exec"
+        )
+        return code
 
 
 def purge_modules() -> None:
-    sys.modules.clear()
-    sys.modules.update(initial_modules)
+    # Only touch the entries a case added or replaced.
+    modules = sys.modules
+    for module_name in modules.keys() - initial_modules.keys():
+        del modules[module_name]
+    for module_name, module in initial_modules.items():
+        if modules.get(module_name) is not module:
+            modules[module_name] = module
+
+
+def run_directly(func: Callable[..., object], *args: object) -> object:
+    return func(*args)
 
 
 @contextmanager
 def reference_tracking(
     *,
-    context: Context,
+    run: Callable[..., object],
     supported: bool,
     tracking: tuple[str, ...],
     subtests: SubTests,
@@ -56,7 +77,7 @@ def reference_tracking(
         untracked = set(tracking_map.values()) - tracked
 
         tracker: defaultdict[type, WeakSet[object]] = defaultdict(WeakSet)
-        context.run(tracker_var.set, tracker)
+        run(tracker_var.set, tracker)
     try:
         yield
     finally:
@@ -93,6 +114,8 @@ class Case(NamedTuple):
         ),
         Case(CASES_DIR / "imports_lazily.py", supported=True),
         Case(CASES_DIR / "imports_lazily.py", supported=False),
+        Case(CASES_DIR / "imports_in_called_functions.py", supported=True),
+        Case(CASES_DIR / "imports_in_called_functions.py", supported=False),
         Case(CASES_DIR / "type_importing.py", supported=True),
         Case(CASES_DIR / "prevents_eager.py", supported=True, tracking=()),
         Case(CASES_DIR / "prevents_eager.py", supported=False, tracking=()),
@@ -112,17 +135,22 @@ def test_file(
     subtests: SubTests,
 ) -> None:
     os.environ["SLOTHY_DISABLE"] = "" if supported else "1"
-    context = copy_context()
+    # Only slothy's tracker needs an isolated context.
+    run = copy_context().run if supported else run_directly
     with reference_tracking(
-        context=context,
+        run=run,
         supported=supported,
         tracking=tracking,
         subtests=subtests,
     ):
-        context.run(
-            runpy.run_path,
-            str(test_file),
-            run_name="tests",
-            init_globals={"subtests": subtests, "supported": supported},
+        run(
+            exec,
+            load_code(test_file),
+            {
+                "__name__": "tests",
+                "__file__": str(test_file),
+                "subtests": subtests,
+                "supported": supported,
+            },
         )
     purge_modules()
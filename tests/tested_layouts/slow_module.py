@@ -0,0 +1,5 @@
+import time
+
+# Give other threads a chance to see this module partially initialized.
+time.sleep(0.1)
+DONE = True